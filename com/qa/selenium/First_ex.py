@@ -1,8 +1,8 @@
-from selenium import webdriver
+from com.qa.selenium.driver_factory import get_driver
 
 from selenium.webdriver.common.keys import Keys
 
-driver = webdriver.Chrome("C:\\Users\\minds9\\PycharmProjects\\Python_Selenium\\drivers\\chromedriver.exe")
+driver = get_driver()
 
 driver.get("http://www.python.org")
 
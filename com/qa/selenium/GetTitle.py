@@ -1,6 +1,6 @@
-from selenium import webdriver
+from com.qa.selenium.driver_factory import get_driver
 
-driver = webdriver.Chrome("C:\\Users\\minds9\\PycharmProjects\\Python_Selenium\\drivers\\chromedriver.exe")
+driver = get_driver()
 
 driver.get('http://www.theTestingWorld.com/testings')
 
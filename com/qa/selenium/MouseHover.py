@@ -1,15 +1,18 @@
-from selenium import webdriver
 from selenium.webdriver import ActionChains
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 
-driver=webdriver.Chrome("C:\\Users\\minds9\\PycharmProjects\\Python_Selenium\\drivers\\chromedriver.exe")
+from com.qa.selenium.driver_factory import get_driver, quit_driver
+
+driver=get_driver()
 driver.set_page_load_timeout(30)
 
 driver.get("http://www.amazon.in")
 driver.maximize_window()
-driver.implicitly_wait(30)
+wait = WebDriverWait(driver, 10)
 
-element=driver.find_element_by_xpath("//a[@id='nav-link-accountList']")
+element=wait.until(EC.visibility_of_element_located((By.XPATH, "//a[@id='nav-link-accountList']")))
 hover = ActionChains(driver).move_to_element(element)
 hover.perform()
-driver.implicitly_wait(40)
-driver.quit()
+quit_driver()
@@ -2,7 +2,8 @@ import openpyxl
 
 #load workbook
 
-wk= openpyxl.load_workbook("D:/TestSheet.xlsx")
+#read_only streams the sheet instead of loading it all, data_only returns cached values instead of formulas
+wk= openpyxl.load_workbook("D:/TestSheet.xlsx", read_only=True, data_only=True)
 
 print(wk.sheetnames)
 
@@ -30,11 +31,9 @@ columns = sh.max_column
 print("Total Rows are - " + str(rows))
 print("Total Columns are - " + str(columns))
 
-for i in range(1,rows+1):
-    for j in range(1,columns+1):
-        c= sh.cell(i,j)
-        print(c.value)
+for row in sh.iter_rows(values_only=True):
+    for v in row:
+        print(v)
 
-for r in sh['A1' : 'C4']:
-    for c in r:
-        print(c.value)
\ No newline at end of file
+#Read-only workbooks keep the file open until closed
+wk.close()
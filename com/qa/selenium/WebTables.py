@@ -1,26 +1,33 @@
 import urllib
 import urllib.request
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import os
 
+#lxml parses in C and is much faster than the built-in html.parser, use it when it is installed
+try:
+    import lxml
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
 def make_soup(url):
     thepage = urllib.request.urlopen(url)
-    soupdata = BeautifulSoup(thepage, "html.parser")
+    #Only build the <tr> elements, the rest of the page is never used
+    only_rows = SoupStrainer("tr")
+    soupdata = BeautifulSoup(thepage.read(), PARSER, parse_only=only_rows)
     return soupdata
 
-playerdatasaved=""
+rows = []
 soup = make_soup("http://www.basketball-reference.com/players/a/")
-for record in soup.find_all('tr'):
-    playerdata = ""
-    for data in record.findAll('td'):
-        playerdata = playerdata+","+data.text
-        print(data.text)
-        playerdatasaved = playerdatasaved + "\n" + playerdata[1:]
+for record in soup.find_all('tr', recursive=False):
+    cells = [data.text for data in record.find_all('td')]
+    if cells:
+        rows.append(",".join(cells))
+playerdatasaved = "\n".join(rows)
 
 header = "Player,From,To,Pos,Ht,Wt,Birth Date,College"
-file = open(os.path.expanduser("Basketball.csv"),"Wb")
-file.write(bytes(header,encoding="ascii",errors='ignore'))
-file.write(bytes(playerdatasaved, encoding="ascii",errors='ignore'))
+with open(os.path.expanduser("Basketball.csv"),"wb") as file:
+    file.write((header + "\n" + playerdatasaved).encode("ascii", "ignore"))
 
 print(playerdatasaved)
 
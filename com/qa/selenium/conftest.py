@@ -0,0 +1,14 @@
+#Run the suite in parallel against a Selenium Grid:
+#   GRID_URL=http://localhost:4444/wd/hub pytest -n 4 com/qa/selenium/
+#Each pytest-xdist worker is its own process, so the unittest classes get one session per worker
+#from driver_factory.get_driver(), while tests asking for the driver fixture get a fresh session.
+import pytest
+
+from com.qa.selenium.driver_factory import new_driver
+
+
+@pytest.fixture(scope="function")
+def driver():
+    drv = new_driver()
+    yield drv
+    drv.quit()
@@ -0,0 +1,46 @@
+import os
+
+from selenium import webdriver
+
+CHROMEDRIVER_PATH = "C:\\Users\\minds9\\PycharmProjects\\Python_Selenium\\drivers\\chromedriver.exe"
+
+#Set SELENIUM_HEADLESS=0 to watch the browser while a script runs
+HEADLESS = os.environ.get("SELENIUM_HEADLESS", "1") != "0"
+
+#Set GRID_URL (e.g. http://localhost:4444/wd/hub) to run on a Selenium Grid instead of a local chromedriver
+GRID_URL = os.environ.get("GRID_URL")
+
+_driver = None
+
+
+def get_options():
+    opts = webdriver.ChromeOptions()
+    if HEADLESS:
+        opts.add_argument("--headless=new")
+        opts.add_argument("--disable-gpu")
+    opts.add_argument("--no-sandbox")
+    #Skip downloading images, the scripts only work with the DOM
+    opts.add_argument("--blink-settings=imagesEnabled=false")
+    opts.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    return opts
+
+
+def new_driver():
+    if GRID_URL:
+        return webdriver.Remote(command_executor=GRID_URL, options=get_options())
+    return webdriver.Chrome(executable_path=CHROMEDRIVER_PATH, options=get_options())
+
+
+def get_driver():
+    #Start Chrome once and hand the same session to every caller
+    global _driver
+    if _driver is None:
+        _driver = new_driver()
+    return _driver
+
+
+def quit_driver():
+    global _driver
+    if _driver is not None:
+        _driver.quit()
+        _driver = None